@@ -0,0 +1,94 @@
+import os
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Configuration
+MAX_SESSIONS = int(os.getenv("GOVERNOR_MAX_SESSIONS", "50"))
+LAG_LIMIT_MS = float(os.getenv("GOVERNOR_LAG_LIMIT_MS", "200"))
+LAG_INTERVAL_S = 0.1
+# Pressure beyond which new sessions are refused outright
+REJECT_PRESSURE = float(os.getenv("GOVERNOR_REJECT_PRESSURE", "1.5"))
+
+# Max concurrent in-flight calls per stage before it counts as saturated
+STAGE_CAPACITY = {
+    "llm": int(os.getenv("GOVERNOR_LLM_CAPACITY", "32")),        # rewriter + voice formatting
+    "qdrant": int(os.getenv("GOVERNOR_QDRANT_CAPACITY", "64")),
+    "rerank": int(os.getenv("GOVERNOR_RERANK_CAPACITY", "8")),    # CPU bound cross-encoder
+    "tts": int(os.getenv("GOVERNOR_TTS_CAPACITY", "32")),
+}
+
+class Degradation(IntEnum):
+    NORMAL = 0
+    NO_SPECULATION = 1   # skip speculative work on partials
+    NO_RERANK = 2        # use vector search order as-is
+    NO_VOICE_LLM = 3     # normalize the answer locally instead of via the LLM
+
+# Pressure (0 = idle, 1 = at capacity) at which each level kicks in
+LEVEL_THRESHOLDS = [
+    (1.0, Degradation.NO_VOICE_LLM),
+    (0.75, Degradation.NO_RERANK),
+    (0.5, Degradation.NO_SPECULATION),
+]
+
+class LoadGovernor:
+    """
+    Process-wide admission control. Tracks in-flight work per stage and
+    event-loop lag, and maps them to a degradation level.
+    """
+    def __init__(self):
+        self.inflight = {stage: 0 for stage in STAGE_CAPACITY}
+        self.sessions = 0
+        self.loop_lag_ms = 0.0
+        self._lag_task = None
+
+    def start(self):
+        if self._lag_task is None:
+            self._lag_task = asyncio.create_task(self._monitor_lag())
+
+    async def _monitor_lag(self):
+        # A blocked loop wakes us late; the overshoot is the lag
+        while True:
+            t0 = time.perf_counter()
+            await asyncio.sleep(LAG_INTERVAL_S)
+            lag_ms = (time.perf_counter() - t0 - LAG_INTERVAL_S) * 1000
+            # Smooth so a single slow tick does not flip the level
+            self.loop_lag_ms = 0.8 * self.loop_lag_ms + 0.2 * max(lag_ms, 0.0)
+
+    def pressure(self) -> float:
+        stage_load = max(self.inflight[s] / STAGE_CAPACITY[s] for s in STAGE_CAPACITY)
+        return max(stage_load, self.loop_lag_ms / LAG_LIMIT_MS)
+
+    def level(self) -> Degradation:
+        pressure = self.pressure()
+        for threshold, level in LEVEL_THRESHOLDS:
+            if pressure >= threshold:
+                return level
+        return Degradation.NORMAL
+
+    @asynccontextmanager
+    async def track(self, stage: str):
+        self.inflight[stage] += 1
+        try:
+            yield
+        finally:
+            self.inflight[stage] -= 1
+
+    def admit_session(self) -> bool:
+        """
+        Hard limit: refuse new sessions when full or already shedding everything.
+        """
+        if self.sessions >= MAX_SESSIONS or self.pressure() >= REJECT_PRESSURE:
+            print(f"Governor: refusing session (sessions={self.sessions}, pressure={self.pressure():.2f})")
+            return False
+        self.sessions += 1
+        return True
+
+    def release_session(self):
+        self.sessions = max(self.sessions - 1, 0)
+
+governor = LoadGovernor()
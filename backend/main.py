@@ -1,6 +1,9 @@
 import os
+import json
+import asyncio
 from fastapi import FastAPI, WebSocket
 from dotenv import load_dotenv
+from backend.governor import governor
 
 # Load environment variables
 load_dotenv()
@@ -10,6 +13,10 @@ app = FastAPI(title="Zero-Latency Voice RAG")
 @app.on_event("startup")
 async def startup_event():
     print("Starting Zero-Latency Voice RAG Engine...")
+    # Load models once, off the loop, before the governor starts measuring lag
+    from backend.speculative import load_models
+    await asyncio.get_running_loop().run_in_executor(None, load_models)
+    governor.start()
 
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
@@ -23,8 +30,19 @@ async def root():
 @app.websocket("/ws")
 async def audio_stream(websocket: WebSocket):
     from backend.stream_manager import StreamManager
-    manager = StreamManager(websocket)
-    await manager.start()
+
+    if not governor.admit_session():
+        # 1013 = Try Again Later
+        await websocket.accept()
+        await websocket.send_text(json.dumps({"type": "overloaded", "retry": True}))
+        await websocket.close(code=1013, reason="Server overloaded")
+        return
+
+    try:
+        manager = StreamManager(websocket)
+        await manager.start()
+    finally:
+        governor.release_session()
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,12 +1,25 @@
 import asyncio
-from rag.retriever import Retriever
+from rag.retriever import Retriever, get_encoder
+from rag.reranker import get_reranker
 from rag.rewriter import QueryRewriter
+from rag.answer_bank import AnswerBank
+from backend.governor import governor, Degradation
+
+def load_models():
+    """
+    Loads the shared encoder and reranker. Blocking; run it off the event loop
+    at startup so sessions never stall the loop (and the governor's lag gauge).
+    """
+    get_encoder()
+    get_reranker()
 
 class SpeculativeEngine:
     def __init__(self):
         self.retriever = Retriever()
         self.rewriter = QueryRewriter()
+        self.answer_bank = AnswerBank(self.retriever.encoder)
         self.cache = {} # Map text_hash -> search_results
+        self.results_cache = {} # Map rewritten query -> (ranked_results, reranked)
         self.history = []
         
     async def process_partial(self, partial_text: str):
@@ -18,13 +31,19 @@ class SpeculativeEngine:
         if len(partial_text.split()) < 4:
             return
 
+        # Speculation is optional work; shed it first under load
+        if governor.level() >= Degradation.NO_SPECULATION:
+            return
+
         print(f"Speculating on: '{partial_text}'")
         
         # 1. Rewrite (Fast)
-        rewritten = await self.rewriter.rewrite(partial_text, self.history)
+        async with governor.track("llm"):
+            rewritten = await self.rewriter.rewrite(partial_text, self.history)
         
         # 2. Search (Parallel)
-        results = await self.retriever.search(rewritten, limit=3)
+        async with governor.track("qdrant"):
+            results = await self.retriever.search(rewritten, limit=3)
         
         # 3. Cache Result
         self.cache[partial_text] = {
@@ -33,13 +52,20 @@ class SpeculativeEngine:
         }
         print(f"Cached speculative result for: '{partial_text}'")
 
-    async def get_final_result(self, final_text: str):
+    async def get_final_result(self, final_text: str, level: Degradation = Degradation.NORMAL):
         """
         Called when ASR gives final result.
-        Check cache, or run fresh search.
+        Check cache, or run fresh search. `level` is the turn's degradation level.
         """
         print(f"Finalizing: '{final_text}'")
         
+        # Prebuilt answer: no rewrite, rerank, LLM formatting or TTS needed.
+        # Follow-ups ("what is its battery life?") are only matched once rewritten below.
+        if not self.history:
+            prebuilt = await self._match_prebuilt(final_text, final_text)
+            if prebuilt:
+                return prebuilt
+        
         # Check if we have a cached result for a "close enough" partial
         # For now, exact string match or contained substring
         if final_text in self.cache:
@@ -48,17 +74,35 @@ class SpeculativeEngine:
         
         # Fallback: Run fresh
         print("CACHE MISS. Running clean pipeline.")
-        rewritten = await self.rewriter.rewrite(final_text, self.history)
+        async with governor.track("llm"):
+            rewritten = await self.rewriter.rewrite(final_text, self.history)
         
-        # 1. Retrieve (Get more candidates for reranking)
-        candidates = await self.retriever.search(rewritten, limit=10)
+        if self.history:
+            prebuilt = await self._match_prebuilt(rewritten, final_text)
+            if prebuilt:
+                return prebuilt
         
-        # 2. Rerank
-        from rag.reranker import Reranker
-        if not hasattr(self, 'reranker'):
-             self.reranker = Reranker()
-             
-        ranked_results = await self.reranker.rerank(rewritten, candidates, top_k=3)
+        # Same rewritten query as an earlier turn (e.g. a VAD turn the ASR final
+        # corrected): reuse its retrieval instead of searching again
+        cached = self.results_cache.get(rewritten)
+        if cached and (cached[1] or level >= Degradation.NO_RERANK):
+            print("Reusing retrieval for unchanged rewritten query")
+            ranked_results, reranked = cached
+        # Under load, skip reranking and trust the vector search order
+        elif level >= Degradation.NO_RERANK:
+            async with governor.track("qdrant"):
+                ranked_results = await self.retriever.search(rewritten, limit=3)
+            reranked = False
+        else:
+            # 1. Retrieve (Get more candidates for reranking)
+            async with governor.track("qdrant"):
+                candidates = await self.retriever.search(rewritten, limit=10)
+            
+            # 2. Rerank
+            async with governor.track("rerank"):
+                ranked_results = await get_reranker().rerank(rewritten, candidates, top_k=3)
+            reranked = True
+        self.results_cache[rewritten] = (ranked_results, reranked)
         
         # Update history
         self.history.append(final_text) 
@@ -67,3 +111,10 @@ class SpeculativeEngine:
             "rewritten": rewritten,
             "results": ranked_results
         }
+
+    async def _match_prebuilt(self, query: str, final_text: str):
+        async with governor.track("qdrant"):
+            prebuilt = await self.answer_bank.match(query)
+        if prebuilt:
+            self.history.append(final_text)
+        return prebuilt
@@ -1,17 +1,41 @@
 import asyncio
 import os
 import json
+import re
 from fastapi import WebSocket
 from deepgram import DeepgramClient
 from dotenv import load_dotenv
+from voice.vad import Endpointer
 
 load_dotenv()
 
+# Wire format of client audio, fixed by frontend/index.html (not configurable)
+AUDIO_ENCODING = "linear16"
+AUDIO_SAMPLE_RATE = 16000
+
+# Local end-of-speech detection on the inbound PCM (see voice/vad.py)
+VAD_ENABLED = os.getenv("VAD_ENABLED", "true").lower() == "true"
+# How long a VAD turn may wait for the ASR final before it is dropped
+PROVISIONAL_TIMEOUT_S = float(os.getenv("VAD_PROVISIONAL_TIMEOUT_S", "3"))
+
+def _normalize(text: str) -> str:
+    # smart_format may change casing/punctuation between partial and final
+    return " ".join(re.sub(r"[^\w\s]", "", text.lower()).split())
+
 class StreamManager:
     def __init__(self, websocket: WebSocket):
         self.fastapi_ws = websocket
         self.dg_client = DeepgramClient(api_key=os.getenv("DEEPGRAM_API_KEY"))
         self.dg_connection = None
+        
+        # Turn state for local endpointing
+        self.endpointer = None
+        if VAD_ENABLED:
+            self.endpointer = Endpointer(sample_rate=AUDIO_SAMPLE_RATE)
+        self.stable_partial = ""
+        self.provisional_text = None
+        self.provisional_task = None
+        self.provisional_timer = None
 
     async def start(self):
         await self.fastapi_ws.accept()
@@ -31,6 +55,9 @@ class StreamManager:
                 smart_format="true",
                 interim_results="true",
                 vad_events="true",
+                encoding=AUDIO_ENCODING,
+                sample_rate=str(AUDIO_SAMPLE_RATE),
+                channels="1",
             )
             # Enter async context
             self.dg_connection = await connection_ctx.__aenter__()
@@ -55,6 +82,9 @@ class StreamManager:
                 if chunk_count % 50 == 0:
                      print(f"Received audio chunk #{chunk_count}, size: {len(data)}")
                 await self.dg_connection.send(data)
+                
+                if self.endpointer and self.endpointer.process(data):
+                    self._on_end_of_speech()
 
         except Exception as e:
             print(f"WebSocket closed: {e}")
@@ -80,56 +110,187 @@ class StreamManager:
              return
              
         sentence = result.channel.alternatives[0].transcript
-        if len(sentence) == 0:
-            return
-            
         is_final = result.is_final
         # speech_final might not be directly on result in V1? 
         # Checking schema... result.speech_final maps to 'speech_final' prop
         speech_final = getattr(result, 'speech_final', False)
         
+        if len(sentence) == 0:
+            # ASR closed the utterance without text: the VAD turn was never confirmed
+            if (is_final or speech_final) and self.provisional_text is not None:
+                print("ASR final is empty, discarding VAD turn")
+                self._discard_provisional()
+            return
+        
         # Speculative Logic
         if is_final:
             print(f"FINAL: {sentence}")
+            self.stable_partial = ""
             
-            # Send Filler immediately
-            from backend.filler import FillerGenerator
-            filler = FillerGenerator().get_filler()
-            await self.fastapi_ws.send_text(json.dumps({
-                "type": "filler",
-                "text": filler
-            }))
-            
-            rag_result = await self.engine.get_final_result(sentence)
-            print(f"RAG RESULT: {rag_result}")
-            
-            # 1. Voice Optimization
-            from voice.processor import VoiceProcessor
-            if not hasattr(self, 'processor'):
-                self.processor = VoiceProcessor()
-                
-            top_answer = rag_result["results"][0] if rag_result["results"] else "I couldn't find that information in the manual."
-            spoken_text = await self.processor.to_spoken_english(top_answer)
-            print(f"SPOKEN: {spoken_text}")
-            
-            # 2. TTS Generation
-            from voice.tts import TTSClient
-            if not hasattr(self, 'tts'):
-                self.tts = TTSClient()
+            # Local VAD already started this turn: confirm or correct it
+            if self.provisional_text is not None:
+                reuse = None
+                if _normalize(self.provisional_text) == _normalize(sentence):
+                    print("ASR final confirms VAD turn")
+                    task = self.provisional_task
+                    self._clear_provisional()
+                    try:
+                        message, audio_bytes = await task
+                    except Exception as e:
+                        print(f"VAD turn failed ({e!r}), answering again")
+                    else:
+                        message["text"] = sentence  # ASR's formatted wording
+                        await self._send_answer(message, audio_bytes)
+                        return
+                else:
+                    print(f"ASR final corrects VAD turn: '{self.provisional_text}' -> '{sentence}'")
+                    reuse = self._discard_provisional()
                 
-            audio_bytes = await self.tts.generate_audio(spoken_text)
+                # Filler already went out when the VAD turn started
+                message, audio_bytes = await self._prepare_answer(sentence, reuse=reuse)
+                await self._send_answer(message, audio_bytes)
+                return
             
-            # Send Metadata and Audio
-            await self.fastapi_ws.send_text(json.dumps({
+            await self._answer_turn(sentence)
+        else:
+            print(f"PARTIAL: {sentence}")
+            self.stable_partial = sentence
+            await self.engine.process_partial(sentence)
+
+    def _on_end_of_speech(self):
+        # Promote the latest partial to a provisional final
+        if not self.stable_partial or self.provisional_text is not None:
+            return
+        # A provisional answer is speculative work: shed it with speculation
+        from backend.governor import governor, Degradation
+        if governor.level() >= Degradation.NO_SPECULATION:
+            return
+        print(f"VAD END OF SPEECH: promoting '{self.stable_partial}'")
+        self.provisional_text = self.stable_partial
+        self.stable_partial = ""
+        self.provisional_task = asyncio.create_task(self._prepare_provisional(self.provisional_text))
+        
+        # Don't let an unconfirmed turn block promotion (or be compared) forever
+        loop = asyncio.get_running_loop()
+        self.provisional_timer = loop.call_later(PROVISIONAL_TIMEOUT_S, self._expire_provisional, self.provisional_task)
+
+    async def _prepare_provisional(self, sentence: str):
+        # Answer is prepared but held back until the ASR final confirms it
+        await self._send_filler()
+        return await self._prepare_answer(sentence)
+
+    def _expire_provisional(self, task):
+        if self.provisional_task is task:
+            print("VAD turn not confirmed in time, discarding")
+            self._discard_provisional()
+
+    def _clear_provisional(self):
+        if self.provisional_timer:
+            self.provisional_timer.cancel()
+        self.provisional_text = None
+        self.provisional_task = None
+        self.provisional_timer = None
+
+    def _discard_provisional(self):
+        """
+        Drops the held-back answer and undoes its history entry. Returns the
+        prepared (message, audio) if it had finished, so a correction can reuse it.
+        """
+        provisional, task = self.provisional_text, self.provisional_task
+        self._clear_provisional()
+        prepared = None
+        if task and not task.done():
+            task.cancel()
+        elif task and not task.cancelled() and task.exception() is None:
+            prepared = task.result()
+        if self.engine.history and self.engine.history[-1] == provisional:
+            self.engine.history.pop()
+        return prepared
+
+    async def _answer_turn(self, sentence: str):
+        await self._send_filler()
+        message, audio_bytes = await self._prepare_answer(sentence)
+        await self._send_answer(message, audio_bytes)
+
+    async def _send_filler(self):
+        # Send Filler immediately
+        from backend.filler import FillerGenerator
+        filler = FillerGenerator().get_filler()
+        await self.fastapi_ws.send_text(json.dumps({
+            "type": "filler",
+            "text": filler
+        }))
+
+    async def _send_answer(self, message: dict, audio_bytes):
+        # Send Metadata and Audio
+        await self.fastapi_ws.send_text(json.dumps(message))
+        if audio_bytes:
+            await self.fastapi_ws.send_bytes(audio_bytes)
+
+    async def _prepare_answer(self, sentence: str, reuse=None):
+        """
+        Runs the answer path for a turn. Returns the final_result message and its audio.
+        `reuse` is a discarded provisional answer whose speech can stand in if the top result matches.
+        """
+        # Degradation level is fixed for the whole turn
+        from backend.governor import governor, Degradation
+        level = governor.level()
+        if level > Degradation.NORMAL:
+            print(f"Governor: degraded turn ({level.name})")
+        
+        rag_result = await self.engine.get_final_result(sentence, level)
+        
+        # Prebuilt answer bank hit: audio is ready, skip formatting and TTS
+        if "audio" in rag_result:
+            audio_bytes = rag_result.pop("audio")
+            return {
                 "type": "final_result",
                 "text": sentence,
                 "rag": rag_result,
-                "spoken_text": spoken_text
-            }))
-            await self.fastapi_ws.send_bytes(audio_bytes)
+                "spoken_text": rag_result["spoken_text"],
+                "degradation": level.name
+            }, audio_bytes
+        
+        print(f"RAG RESULT: {rag_result}")
+        
+        # Correction landed on the same answer: skip voice formatting and TTS
+        if reuse and reuse[0]["rag"]["results"][:1] == rag_result["results"][:1]:
+            print("Reusing provisional speech for corrected turn")
+            message, audio_bytes = reuse
+            return {**message, "text": sentence, "rag": rag_result, "degradation": level.name}, audio_bytes
+        
+        # 1. Voice Optimization
+        from voice.processor import VoiceProcessor
+        if not hasattr(self, 'processor'):
+            self.processor = VoiceProcessor()
+            
+        top_answer = rag_result["results"][0] if rag_result["results"] else "I couldn't find that information in the manual."
+        if level >= Degradation.NO_VOICE_LLM:
+            spoken_text = self.processor.normalize_locally(top_answer)
         else:
-            print(f"PARTIAL: {sentence}")
-            await self.engine.process_partial(sentence)
+            async with governor.track("llm"):
+                spoken_text = await self.processor.to_spoken_english(top_answer)
+        print(f"SPOKEN: {spoken_text}")
+        
+        # 2. TTS Generation
+        from voice.tts import TTSClient
+        if not hasattr(self, 'tts'):
+            self.tts = TTSClient()
+            
+        try:
+            async with governor.track("tts"):
+                audio_bytes = await self.tts.generate_audio(spoken_text)
+        except Exception as e:
+            print(f"TTS Error: {e}")
+            audio_bytes = None
+        
+        return {
+            "type": "final_result",
+            "text": sentence,
+            "rag": rag_result,
+            "spoken_text": spoken_text,
+            "degradation": level.name
+        }, audio_bytes
 
     def on_error(self, error, **kwargs):
         print(f"Deepgram Error: {error}")
@@ -0,0 +1,178 @@
+import asyncio
+import time
+import httpx
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from qdrant_client import QdrantClient, AsyncQdrantClient, models
+from rag.ingestion import collection_config
+from rag.retriever import QDRANT_URL, QDRANT_API_KEY, QDRANT_GRPC_PORT, PAYLOAD_FIELDS, search_params
+
+# Synthetic corpus roughly the size of a large manual
+NUM_POINTS = 20000
+DIM = 384
+NUM_QUERIES = 200
+BATCH_SIZE = 8
+LIMIT = 10
+INDEX_TIMEOUT_S = 300
+# Small threshold and few segments so every variant really gets an HNSW index;
+# with server defaults 20k vectors can stay below the per-segment threshold.
+BENCH_OPTIMIZERS = models.OptimizersConfigDiff(default_segment_number=2, indexing_threshold=1000)  # KB
+
+# Collection layouts to compare (one collection at a time so server RAM deltas are isolated)
+VARIANTS = [
+    {"name": "plain_m16", "quantization": "none", "m": 16, "ef_construct": 100, "on_disk": False},
+    {"name": "plain_m32", "quantization": "none", "m": 32, "ef_construct": 200, "on_disk": False},
+    {"name": "int8_m16", "quantization": "int8", "m": 16, "ef_construct": 100, "on_disk": False},
+    {"name": "int8_m16_disk", "quantization": "int8", "m": 16, "ef_construct": 100, "on_disk": True},
+]
+# Search-time beam widths, compared on every collection
+HNSW_EF_VALUES = [32, 64, 128]
+
+def client_kwargs():
+    kwargs = {"url": QDRANT_URL}
+    if not QDRANT_URL.startswith("http://localhost"):
+        kwargs["api_key"] = QDRANT_API_KEY
+    return kwargs
+
+def make_vectors(n, seed):
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((n, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+def server_memory_bytes():
+    """
+    Resident memory of the Qdrant server, from its Prometheus /metrics endpoint.
+    """
+    headers = {"api-key": QDRANT_API_KEY} if QDRANT_API_KEY and not QDRANT_URL.startswith("http://localhost") else {}
+    response = httpx.get(f"{QDRANT_URL.rstrip('/')}/metrics", headers=headers)
+    response.raise_for_status()
+    metrics = {}
+    for line in response.text.splitlines():
+        if line.startswith("memory_"):
+            name, value = line.split()[:2]
+            metrics[name] = float(value)
+    return metrics.get("memory_resident_bytes", metrics.get("memory_allocated_bytes", 0.0))
+
+def wait_until_indexed(client, name) -> bool:
+    """
+    Waits for background HNSW/quantization builds. Returns False (instead of
+    hanging) if the collection settles without indexing every vector.
+    """
+    deadline = time.time() + INDEX_TIMEOUT_S
+    indexed = 0
+    stable_polls = 0
+    while time.time() < deadline:
+        info = client.get_collection(collection_name=name)
+        previous, indexed = indexed, info.indexed_vectors_count or 0
+        if info.status == models.CollectionStatus.GREEN:
+            if indexed >= NUM_POINTS:
+                return True
+            # Green and no progress for a while: the rest stays on the plain index
+            stable_polls = stable_polls + 1 if indexed == previous else 0
+            if stable_polls >= 10:
+                break
+        time.sleep(0.5)
+    print(f"WARNING: {name} has only {indexed}/{NUM_POINTS} vectors HNSW-indexed; "
+          f"its timings include plain (brute-force) segments")
+    return False
+
+def setup_collection(client, variant, vectors):
+    name = f"bench_{variant['name']}"
+    print(f"\nCreating {name}...")
+    config = collection_config(variant["quantization"], variant["m"], variant["ef_construct"], variant["on_disk"])
+    client.recreate_collection(collection_name=name, optimizers_config=BENCH_OPTIMIZERS, **config)
+    for i in range(0, len(vectors), 500):
+        batch = vectors[i:i+500]
+        client.upsert(
+            collection_name=name,
+            points=[
+                models.PointStruct(id=i + idx, vector=v.tolist(), payload={"text": f"chunk {i + idx}", "extra": "x" * 400})
+                for idx, v in enumerate(batch)
+            ],
+        )
+    indexed = wait_until_indexed(client, name)
+    return name, indexed
+
+def exact_neighbours(client, name, queries):
+    return [
+        {p.id for p in client.query_points(collection_name=name, query=q.tolist(), limit=LIMIT,
+                                           search_params=models.SearchParams(exact=True), with_payload=False).points}
+        for q in queries
+    ]
+
+def summarize(label, timings, recall=None):
+    ms = np.array(timings) * 1000
+    line = f"  {label:<36} p50={np.percentile(ms, 50):7.2f}ms  p95={np.percentile(ms, 95):7.2f}ms"
+    if recall is not None:
+        line += f"  recall@{LIMIT}={recall:.3f}"
+    print(line)
+
+def bench_rest_sync(name, queries, with_payload):
+    client = QdrantClient(**client_kwargs())
+    timings = []
+    for q in queries:
+        t0 = time.perf_counter()
+        client.query_points(collection_name=name, query=q.tolist(), limit=LIMIT,
+                            search_params=search_params(), with_payload=with_payload)
+        timings.append(time.perf_counter() - t0)
+    client.close()
+    return timings
+
+async def bench_grpc_async(name, queries, batch_size, hnsw_ef, truth=None):
+    client = AsyncQdrantClient(prefer_grpc=True, grpc_port=QDRANT_GRPC_PORT, **client_kwargs())
+    params = search_params(hnsw_ef)
+    timings = []
+    hits = []
+    for i in range(0, len(queries), batch_size):
+        chunk = queries[i:i+batch_size]
+        t0 = time.perf_counter()
+        if batch_size == 1:
+            responses = [await client.query_points(collection_name=name, query=chunk[0].tolist(), limit=LIMIT,
+                                                   search_params=params, with_payload=PAYLOAD_FIELDS)]
+        else:
+            responses = await client.query_batch_points(
+                collection_name=name,
+                requests=[
+                    models.QueryRequest(query=q.tolist(), limit=LIMIT, params=params, with_payload=PAYLOAD_FIELDS)
+                    for q in chunk
+                ],
+            )
+        # Report per-query latency so single and batched runs are comparable
+        timings.extend([(time.perf_counter() - t0) / len(chunk)] * len(chunk))
+        hits.extend({p.id for p in r.points} for r in responses)
+    await client.close()
+
+    recall = None
+    if truth is not None:
+        recall = float(np.mean([len(h & t) / LIMIT for h, t in zip(hits, truth)]))
+    return timings, recall
+
+async def main():
+    print("--- Qdrant Retrieval Benchmark ---")
+    vectors = make_vectors(NUM_POINTS, seed=0)
+    queries = make_vectors(NUM_QUERIES, seed=1)
+
+    admin = QdrantClient(**client_kwargs())
+    for variant in VARIANTS:
+        ram_before = server_memory_bytes()
+        name, indexed = setup_collection(admin, variant, vectors)
+        ram_after = server_memory_bytes()
+        print(f"[{name}] server RAM delta: {(ram_after - ram_before) / 2**20:.1f}MiB "
+              f"(resident {ram_after / 2**20:.1f}MiB){'' if indexed else ' [partly unindexed]'}")
+
+        truth = exact_neighbours(admin, name, queries)
+
+        summarize("REST sync, full payload", bench_rest_sync(name, queries, True))
+        summarize("REST sync, text payload only", bench_rest_sync(name, queries, PAYLOAD_FIELDS))
+        for hnsw_ef in HNSW_EF_VALUES:
+            summarize(f"gRPC async, single, hnsw_ef={hnsw_ef}", *await bench_grpc_async(name, queries, 1, hnsw_ef, truth))
+        summarize(f"gRPC async, batch of {BATCH_SIZE}", *await bench_grpc_async(name, queries, BATCH_SIZE, HNSW_EF_VALUES[1], truth))
+
+        admin.delete_collection(collection_name=name)
+    admin.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,204 @@
+import os
+import json
+import shutil
+import asyncio
+import functools
+from groq import Groq
+from qdrant_client import models
+from dotenv import load_dotenv
+
+from rag.ingestion import collection_config
+from rag.retriever import get_qdrant_client, search_params
+
+load_dotenv()
+
+# Configuration
+ANSWER_BANK_DIR = os.getenv("ANSWER_BANK_DIR", "answer_bank")
+QUESTION_COLLECTION_NAME = "anticipated_questions"
+QUESTIONS_PER_CHUNK = int(os.getenv("ANSWER_BANK_QUESTIONS_PER_CHUNK", "3"))
+# Cosine similarity needed before we trust a prebuilt answer
+MATCH_THRESHOLD = float(os.getenv("ANSWER_BANK_THRESHOLD", "0.85"))
+INDEX_FILE = "answers.json"
+
+def clear_answer_bank(qdrant):
+    """
+    Removes the stored answers, audio and question index. Called whenever the
+    corpus is re-indexed so answers from an old manual are never served.
+    """
+    if os.path.isdir(ANSWER_BANK_DIR):
+        shutil.rmtree(ANSWER_BANK_DIR)
+    try:
+        qdrant.delete_collection(collection_name=QUESTION_COLLECTION_NAME)
+    except Exception as e:
+        print(f"Answer Bank Cleanup Error: {e}")
+
+class AnswerBankBuilder:
+    """
+    Offline stage: generates likely questions per chunk, indexes them and
+    stores the spoken answer plus its synthesized audio on disk.
+    """
+    def __init__(self, encoder, qdrant):
+        from voice.processor import VoiceProcessor
+        from voice.tts import TTSClient
+
+        self.encoder = encoder
+        self.qdrant = qdrant
+        self.client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+        self.model = "llama-3.1-8b-instant"
+        self.processor = VoiceProcessor()
+        self.tts = TTSClient()
+
+    def generate_questions(self, chunk: str) -> list[str]:
+        system_prompt = f"""You generate the questions a caller might ask a support line that the given manual excerpt fully answers.
+        Output at most {QUESTIONS_PER_CHUNK} short spoken-style questions, one per line. No numbering, no explanation.
+        If the excerpt answers nothing useful, output nothing.
+        """
+
+        try:
+            chat_completion = self.client.chat.completions.create(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": chunk}
+                ],
+                model=self.model,
+                temperature=0.3,
+                max_tokens=120,
+            )
+            lines = chat_completion.choices[0].message.content.splitlines()
+        except Exception as e:
+            print(f"Question Generation Error: {e}")
+            return []
+
+        questions = [line.strip(" -*\t") for line in lines]
+        return [q for q in questions if q.endswith("?")][:QUESTIONS_PER_CHUNK]
+
+    async def build(self, chunks):
+        print("Building answer bank...")
+        clear_answer_bank(self.qdrant)
+        os.makedirs(ANSWER_BANK_DIR, exist_ok=True)
+
+        self.qdrant.recreate_collection(
+            collection_name=QUESTION_COLLECTION_NAME,
+            **collection_config(),
+        )
+
+        answers = {}
+        question_id = 0
+        for chunk_id, chunk in enumerate(chunks):
+            questions = self.generate_questions(chunk)
+            if not questions:
+                continue
+
+            spoken_text = await self.processor.to_spoken_english(chunk)
+            try:
+                audio_bytes = await self.tts.generate_audio(spoken_text)
+            except Exception as e:
+                # Never store an error body as audio; this chunk just won't be prebuilt
+                print(f"Answer bank: skipping chunk {chunk_id}, TTS failed: {e}")
+                continue
+
+            audio_file = f"{chunk_id}.mp3"
+            with open(os.path.join(ANSWER_BANK_DIR, audio_file), "wb") as f:
+                f.write(audio_bytes)
+
+            answers[str(chunk_id)] = {
+                "text": chunk,
+                "spoken_text": spoken_text,
+                "audio": audio_file,
+                "questions": questions,
+            }
+
+            embeddings = self.encoder.encode(questions).tolist()
+            self.qdrant.upsert(
+                collection_name=QUESTION_COLLECTION_NAME,
+                points=[
+                    models.PointStruct(
+                        id=question_id + idx,
+                        vector=embedding,
+                        # Each point carries its own answer, so lookups never join
+                        # against a possibly stale copy of answers.json
+                        payload={
+                            "chunk_id": chunk_id,
+                            "question": question,
+                            "text": chunk,
+                            "spoken_text": spoken_text,
+                            "audio": audio_file,
+                        }
+                    )
+                    for idx, (question, embedding) in enumerate(zip(questions, embeddings))
+                ]
+            )
+            question_id += len(questions)
+            print(f"Answer bank: chunk {chunk_id + 1}/{len(chunks)} ({len(questions)} questions)")
+
+        with open(os.path.join(ANSWER_BANK_DIR, INDEX_FILE), "w") as f:
+            json.dump(answers, f)
+
+        print(f"Answer bank complete: {len(answers)} answers, {question_id} questions.")
+
+class AnswerBank:
+    """
+    Call-time lookup of prebuilt answers. Disabled while no bank is built.
+    """
+    def __init__(self, encoder):
+        self.encoder = encoder
+        self.qdrant = get_qdrant_client()
+        self.params = search_params()
+
+    @property
+    def enabled(self) -> bool:
+        # answers.json is written last, so it only exists for a complete build
+        return os.path.exists(os.path.join(ANSWER_BANK_DIR, INDEX_FILE))
+
+    async def match(self, query: str):
+        """
+        Returns the prebuilt answer (including audio bytes) for a confident
+        match against the question index, or None.
+        """
+        if not self.enabled:
+            return None
+
+        loop = asyncio.get_running_loop()
+        vector = await loop.run_in_executor(
+            None,
+            functools.partial(self.encoder.encode, query)
+        )
+
+        try:
+            response = await self.qdrant.query_points(
+                collection_name=QUESTION_COLLECTION_NAME,
+                query=vector.tolist(),
+                limit=1,
+                search_params=self.params,
+                with_payload=["question", "text", "spoken_text", "audio"],
+            )
+        except Exception as e:
+            print(f"Answer Bank Error: {e}")
+            return None
+
+        if not response.points or response.points[0].score < MATCH_THRESHOLD:
+            return None
+
+        hit = response.points[0]
+        entry = hit.payload
+
+        audio_path = os.path.join(ANSWER_BANK_DIR, entry["audio"])
+        try:
+            audio_bytes = await loop.run_in_executor(None, _read_bytes, audio_path)
+        except OSError as e:
+            print(f"Answer Bank Error: {e}")
+            return None
+
+        print(f"ANSWER BANK HIT ({hit.score:.2f}): '{entry['question']}'")
+        return {
+            "rewritten": query,
+            "results": [entry["text"]],
+            "spoken_text": entry["spoken_text"],
+            "audio": audio_bytes,
+            "matched_question": entry["question"],
+            "score": hit.score,
+        }
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
@@ -15,9 +15,43 @@ QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
 COLLECTION_NAME = "manual_chunks"
 EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"  # Fast, local, good enough
 
+# Collection tuning
+QDRANT_QUANTIZATION = os.getenv("QDRANT_QUANTIZATION", "none")  # "none" or "int8" (opt-in)
+# Keep original float32 vectors on disk (only worthwhile with int8 quantization)
+QDRANT_VECTORS_ON_DISK = os.getenv("QDRANT_VECTORS_ON_DISK", "false").lower() == "true"
+QDRANT_HNSW_M = int(os.getenv("QDRANT_HNSW_M", "16"))
+QDRANT_HNSW_EF_CONSTRUCT = int(os.getenv("QDRANT_HNSW_EF_CONSTRUCT", "100"))
+# Optional stage: precompute questions, spoken answers and audio (see rag/answer_bank.py)
+BUILD_ANSWER_BANK = os.getenv("BUILD_ANSWER_BANK", "false").lower() == "true"
+
+def collection_config(quantization: str = QDRANT_QUANTIZATION,
+                      m: int = QDRANT_HNSW_M,
+                      ef_construct: int = QDRANT_HNSW_EF_CONSTRUCT,
+                      on_disk: bool = QDRANT_VECTORS_ON_DISK):
+    """
+    Builds the create-collection arguments for the given tuning options.
+    """
+    config = {
+        "vectors_config": VectorParams(size=384, distance=Distance.COSINE, on_disk=on_disk),
+        "hnsw_config": models.HnswConfigDiff(m=m, ef_construct=ef_construct),
+    }
+    if quantization == "int8":
+        # int8 vectors stay in RAM; originals are used for rescoring
+        config["quantization_config"] = models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True,
+            )
+        )
+    elif quantization != "none":
+        raise ValueError(f"Unknown quantization: {quantization}")
+    return config
+
 class IngestionPipeline:
-    def __init__(self):
+    def __init__(self, quantization: str = QDRANT_QUANTIZATION):
         print("Initializing Ingestion Pipeline...")
+        self.quantization = quantization
         self.encoder = SentenceTransformer(EMBEDDING_MODEL_NAME)
         
         # Connect to Qdrant
@@ -51,11 +85,16 @@ class IngestionPipeline:
     def index_chunks(self, chunks):
         print("Creating embeddings and indexing...")
         
+        # Prebuilt answers belong to the previous corpus; drop them
+        from rag.answer_bank import clear_answer_bank
+        clear_answer_bank(self.qdrant)
+
         # Recreate collection to ensure clean slate
         self.qdrant.recreate_collection(
             collection_name=COLLECTION_NAME,
-            vectors_config=VectorParams(size=384, distance=Distance.COSINE),
+            **collection_config(self.quantization),
         )
+        print(f"Collection created (quantization={self.quantization}, m={QDRANT_HNSW_M}, ef_construct={QDRANT_HNSW_EF_CONSTRUCT})")
 
         # Batch processing
         batch_size = 100
@@ -94,5 +133,10 @@ async def main():
     chunks = pipeline.chunk_text(raw_text)
     pipeline.index_chunks(chunks)
 
+    if BUILD_ANSWER_BANK:
+        from rag.answer_bank import AnswerBankBuilder
+        builder = AnswerBankBuilder(pipeline.encoder, pipeline.qdrant)
+        await builder.build(chunks)
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -27,3 +27,14 @@ class Reranker:
         
         # Return top_k docs
         return [doc for doc, score in results[:top_k]]
+
+_shared_reranker = None
+
+def get_reranker() -> Reranker:
+    """
+    Returns the process-wide cross-encoder, loaded on first use.
+    """
+    global _shared_reranker
+    if _shared_reranker is None:
+        _shared_reranker = Reranker()
+    return _shared_reranker
@@ -1,5 +1,7 @@
 import os
-from qdrant_client import QdrantClient
+import asyncio
+import functools
+from qdrant_client import AsyncQdrantClient, models
 from sentence_transformers import SentenceTransformer
 from dotenv import load_dotenv
 
@@ -10,38 +12,141 @@ QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
 COLLECTION_NAME = "manual_chunks"
 EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
 
+# Transport / search tuning
+QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "true").lower() == "true"
+QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+QDRANT_HNSW_EF = int(os.getenv("QDRANT_HNSW_EF", "64"))
+# How long to wait for other searches to join a batch (0 = just yield once)
+BATCH_WINDOW_MS = float(os.getenv("QDRANT_BATCH_WINDOW_MS", "0"))
+
+# Only the payload field we actually read is sent back over the wire
+PAYLOAD_FIELDS = ["text"]
+
+_shared_client = None
+_shared_encoder = None
+
+def get_qdrant_client() -> AsyncQdrantClient:
+    """
+    Returns the process-wide AsyncQdrantClient so every session reuses one connection.
+    """
+    global _shared_client
+    if _shared_client is None:
+        kwargs = {
+            "url": QDRANT_URL,
+            "prefer_grpc": QDRANT_PREFER_GRPC,
+            "grpc_port": QDRANT_GRPC_PORT,
+        }
+        if not QDRANT_URL.startswith("http://localhost"):
+            kwargs["api_key"] = QDRANT_API_KEY
+        _shared_client = AsyncQdrantClient(**kwargs)
+    return _shared_client
+
+def get_encoder() -> SentenceTransformer:
+    """
+    Returns the process-wide embedding model; loading it takes seconds, so do it once.
+    """
+    global _shared_encoder
+    if _shared_encoder is None:
+        _shared_encoder = SentenceTransformer(EMBEDDING_MODEL_NAME)
+    return _shared_encoder
+
+def search_params(hnsw_ef: int = QDRANT_HNSW_EF) -> models.SearchParams:
+    # rescore=True re-ranks quantized candidates with the original vectors;
+    # it is ignored on collections without quantization.
+    return models.SearchParams(
+        hnsw_ef=hnsw_ef,
+        quantization=models.QuantizationSearchParams(rescore=True),
+    )
+
 class Retriever:
     def __init__(self):
         print("Initializing Retriever...")
-        self.encoder = SentenceTransformer(EMBEDDING_MODEL_NAME)
-        
-        if QDRANT_URL.startswith("http://localhost"):
-            self.qdrant = QdrantClient(url=QDRANT_URL)
-        else:
-            self.qdrant = QdrantClient(url=QDRANT_URL, api_key=QDRANT_API_KEY)
+        self.encoder = get_encoder()
+        self.qdrant = get_qdrant_client()
+        self.params = search_params()
+
+        # Searches waiting to be sent together: (query, limit, future)
+        self._pending = []
+        self._flush_task = None
 
     async def search(self, query: str, limit: int = 5):
+        """
+        Queues the query and waits for its results. Searches issued while
+        another one is pending (e.g. several speculative partials) are sent
+        to Qdrant as a single batch request.
+        """
         print(f"Searching for: {query}")
-        vector = self.encoder.encode(query).tolist()
-        
-        # Use query_points for compatibility with newer clients
-        # Note: query_points returns QueryResponse, we need .points
-        try:
-             # Try modern API
-            response = self.qdrant.query_points(
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((query, limit, future))
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+
+        return await future
+
+    async def search_batch(self, queries: list[str], limit: int = 5):
+        """
+        Runs several queries in one round trip. Returns one list of texts per query.
+        """
+        if not queries:
+            return []
+
+        loop = asyncio.get_running_loop()
+        vectors = await loop.run_in_executor(
+            None,
+            functools.partial(self.encoder.encode, queries)
+        )
+
+        if len(queries) == 1:
+            response = await self.qdrant.query_points(
                 collection_name=COLLECTION_NAME,
-                query=vector,
-                limit=limit
+                query=vectors[0].tolist(),
+                limit=limit,
+                search_params=self.params,
+                with_payload=PAYLOAD_FIELDS,
             )
-            hits = response.points
-        except AttributeError:
-             # Fallback if older client or different structure
-            hits = self.qdrant.search(
+            responses = [response]
+        else:
+            requests = [
+                models.QueryRequest(
+                    query=vector.tolist(),
+                    limit=limit,
+                    params=self.params,
+                    with_payload=PAYLOAD_FIELDS,
+                )
+                for vector in vectors
+            ]
+            responses = await self.qdrant.query_batch_points(
                 collection_name=COLLECTION_NAME,
-                query_vector=vector,
-                limit=limit
+                requests=requests
             )
-        
+
         # Extract text from payload
-        texts = [hit.payload["text"] for hit in hits]
-        return texts
+        return [[hit.payload["text"] for hit in response.points] for response in responses]
+
+    async def _flush(self):
+        # Give concurrent callers a chance to join this batch
+        if BATCH_WINDOW_MS > 0:
+            await asyncio.sleep(BATCH_WINDOW_MS / 1000)
+        else:
+            await asyncio.sleep(0)
+
+        pending, self._pending = self._pending, []
+        self._flush_task = None
+
+        # Use the largest limit and trim per query afterwards
+        limit = max(item[1] for item in pending)
+        if len(pending) > 1:
+            print(f"Batching {len(pending)} searches into one request")
+
+        try:
+            all_texts = await self.search_batch([item[0] for item in pending], limit=limit)
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, item_limit, future), texts in zip(pending, all_texts):
+            if not future.done():
+                future.set_result(texts[:item_limit])
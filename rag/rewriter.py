@@ -1,12 +1,12 @@
 import os
-from groq import Groq
+from groq import AsyncGroq
 from dotenv import load_dotenv
 
 load_dotenv()
 
 class QueryRewriter:
     def __init__(self):
-        self.client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+        self.client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
         self.model = "llama-3.1-8b-instant" # Updated to supported model
 
     async def rewrite(self, query: str, history: list[str]) -> str:
@@ -31,9 +31,8 @@ class QueryRewriter:
         ]
         
         try:
-            # We use synchronous call here as Groq is extremely fast, 
-            # but in production you might want to wrap this in run_in_executor
-            chat_completion = self.client.chat.completions.create(
+            # Async client so the event loop keeps serving other callers meanwhile
+            chat_completion = await self.client.chat.completions.create(
                 messages=messages,
                 model=self.model,
                 temperature=0,
@@ -1,12 +1,20 @@
 import os
-from groq import Groq
+import re
+from groq import AsyncGroq
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Unit suffixes expanded by the local (no-LLM) normalizer
+UNITS = {
+    "V": "volts", "A": "amps", "W": "watts", "Hz": "hertz", "MHz": "megahertz", "GHz": "gigahertz",
+    "KB": "kilobytes", "MB": "megabytes", "GB": "gigabytes", "TB": "terabytes",
+    "ms": "milliseconds", "mm": "millimeters", "cm": "centimeters", "kg": "kilograms",
+}
+
 class VoiceProcessor:
     def __init__(self):
-        self.client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+        self.client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
         self.model = "llama-3.1-8b-instant"
 
     async def to_spoken_english(self, text: str) -> str:
@@ -27,7 +35,7 @@ class VoiceProcessor:
         """
         
         try:
-            chat_completion = self.client.chat.completions.create(
+            chat_completion = await self.client.chat.completions.create(
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": text}
@@ -40,3 +48,28 @@ class VoiceProcessor:
         except Exception as e:
             print(f"Voice Processor Error: {e}")
             return text
+
+    def normalize_locally(self, text: str) -> str:
+        """
+        Cheap rule-based fallback for to_spoken_english, used when the server
+        is shedding LLM work. Strips Markdown and expands common units.
+        """
+        text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)   # [label](link) -> label
+        text = re.sub(r"https?://\S+", "", text)
+        text = re.sub(r"^\s*[#>]+\s*", "", text, flags=re.M)    # headings, quotes
+        text = re.sub(r"(?<!\w)_([^_\n]+)_(?!\w)", r"\1", text)  # _emphasis_, not snake_case
+        text = re.sub(r"[*`\[\]]", "", text)
+
+        # One-letter units must be attached ("5V", not "2 A user"); longer ones may have a space
+        single = "|".join(u for u in UNITS if len(u) == 1)
+        multi = "|".join(u for u in UNITS if len(u) > 1)
+        unit_pattern = rf"\b(\d+(?:\.\d+)?)(?:({single})|\s?({multi}))\b"
+        text = re.sub(unit_pattern, lambda m: f"{m.group(1)} {UNITS[m.group(2) or m.group(3)]}", text)
+
+        # "5 volts/2 amps" -> "5 volts and 2 amps"; fractions and dates are left alone
+        spoken = "|".join(UNITS.values())
+        text = re.sub(rf"(\d+(?:\.\d+)? (?:{spoken}))/(?=\d+(?:\.\d+)? (?:{spoken})\b)", r"\1 and ", text)
+
+        # Keep it short enough to speak: first three sentences
+        sentences = re.split(r"(?<=[.!?])\s+", " ".join(text.split()))
+        return " ".join(sentences[:3])
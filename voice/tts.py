@@ -52,6 +52,8 @@ class TTSClient:
         
         async with httpx.AsyncClient() as client:
             response = await client.post(url, headers=headers, json={"text": text})
+            # Don't hand an error body back as audio
+            response.raise_for_status()
             return response.content
 
     async def generate_audio_stream(self, text: str):
@@ -0,0 +1,104 @@
+import os
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Configuration (inbound audio is 16-bit mono PCM; the sample rate comes from the caller)
+FRAME_MS = int(os.getenv("VAD_FRAME_MS", "20"))
+SILENCE_MS = int(os.getenv("VAD_SILENCE_MS", "300"))        # trailing silence that ends a turn
+MIN_SPEECH_MS = int(os.getenv("VAD_MIN_SPEECH_MS", "200"))  # ignore clicks and short noises
+ENERGY_MARGIN_DB = float(os.getenv("VAD_ENERGY_MARGIN_DB", "10"))
+INITIAL_NOISE_FLOOR_DB = -60.0   # adapted from the audio once silence is seen
+# Max upward drift of the floor while the audio stays above the loudness gate, so
+# a too-low start catches up with steady noise but speech can't drag it along
+NOISE_RISE_DB_PER_S = 1.0
+
+# Speech band and spectral thresholds
+SPEECH_BAND_HZ = (300, 3400)
+MIN_BAND_RATIO = 0.5     # share of energy inside the speech band
+MAX_FLATNESS = 0.5       # 1.0 = white noise, speech is far more tonal
+
+class Endpointer:
+    """
+    Streaming voice-activity detector. Feed raw PCM chunks to `process`;
+    it returns True once when a stretch of speech is followed by enough silence.
+    """
+    def __init__(self, sample_rate: int, frame_ms: int = FRAME_MS,
+                 silence_ms: int = SILENCE_MS, min_speech_ms: int = MIN_SPEECH_MS):
+        self.frame_len = sample_rate * frame_ms // 1000
+        self.frame_ms = frame_ms
+        self.silence_frames = max(silence_ms // frame_ms, 1)
+        self.min_speech_frames = max(min_speech_ms // frame_ms, 1)
+
+        freqs = np.fft.rfftfreq(self.frame_len, d=1.0 / sample_rate)
+        self.band_mask = (freqs >= SPEECH_BAND_HZ[0]) & (freqs <= SPEECH_BAND_HZ[1])
+        self.window = np.hanning(self.frame_len).astype(np.float32)
+
+        self.noise_floor_db = INITIAL_NOISE_FLOOR_DB
+        self._leftover = b""
+        self.reset()
+
+    def reset(self):
+        self.speech_run = 0      # speech frames in the current utterance
+        self.silence_run = 0     # consecutive non-speech frames since last speech
+        self.in_speech = False
+
+    def classify(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Returns a boolean speech flag per frame. `frames` is (n_frames, frame_len) float32.
+        """
+        # Energy in dBFS per frame
+        rms = np.sqrt(np.mean(frames ** 2, axis=1) + 1e-12)
+        energy_db = 20 * np.log10(rms + 1e-12)
+
+        # Spectral features over all frames at once
+        power = np.abs(np.fft.rfft(frames * self.window, axis=1)) ** 2 + 1e-12
+        band_ratio = power[:, self.band_mask].sum(axis=1) / power.sum(axis=1)
+        flatness = np.exp(np.mean(np.log(power), axis=1)) / np.mean(power, axis=1)
+
+        loud = energy_db > self.noise_floor_db + ENERGY_MARGIN_DB
+        voiced = (band_ratio > MIN_BAND_RATIO) & (flatness < MAX_FLATNESS)
+        is_speech = loud & voiced
+
+        # Track the noise floor only from frames below the loudness gate. Loud frames
+        # that merely fail the spectral test (fricatives, low voices) are still speech.
+        if not loud.all():
+            quiet = max(float(np.median(energy_db[~loud])), -90.0)  # ignore digital silence
+            self.noise_floor_db = 0.95 * self.noise_floor_db + 0.05 * quiet
+        else:
+            rise = NOISE_RISE_DB_PER_S * self.frame_ms / 1000 * len(energy_db)
+            self.noise_floor_db = min(self.noise_floor_db + rise, float(energy_db.min()))
+
+        return is_speech
+
+    def process(self, data: bytes) -> bool:
+        """
+        Consumes a PCM chunk. Returns True if end of speech was detected in it.
+        """
+        data = self._leftover + data
+        frame_bytes = self.frame_len * 2
+        usable = len(data) - len(data) % frame_bytes
+        self._leftover = data[usable:]
+        if usable == 0:
+            return False
+
+        samples = np.frombuffer(data[:usable], dtype=np.int16).astype(np.float32) / 32768.0
+        is_speech = self.classify(samples.reshape(-1, self.frame_len))
+
+        ended = False
+        for speech in is_speech:
+            if speech:
+                self.speech_run += 1
+                self.silence_run = 0
+                if self.speech_run >= self.min_speech_frames:
+                    self.in_speech = True
+            else:
+                self.silence_run += 1
+                if self.in_speech and self.silence_run >= self.silence_frames:
+                    ended = True
+                    self.reset()
+                elif not self.in_speech and self.silence_run >= self.silence_frames:
+                    # Short blip that never became speech
+                    self.speech_run = 0
+        return ended